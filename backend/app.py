@@ -1,91 +1,248 @@
 import os
 import json
-from typing import Any, Dict, Optional
-
-from flask import Flask, jsonify, request, send_from_directory
+import gzip
+import hashlib
+import math
+import re
+import threading
+import time
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout, as_completed
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from flask import Flask, Response, request
+from flask_compress import Compress
 from flask_cors import CORS
+import ijson
+import brotli
+import orjson
 import requests
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
-load_dotenv()
+try:
+	from lxml import etree
+	_XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True)
+except ImportError:
+	import xml.etree.ElementTree as etree
+	_XML_PARSER = None
 
-app = Flask(__name__)
-CORS(app)
+load_dotenv()
 
 FRONTEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "frontend"))
 
+# Frontend assets are served by Flask's static handler straight from FRONTEND_DIR
+app = Flask(__name__, static_folder=FRONTEND_DIR, static_url_path="")
+# Only dynamic JSON is compressed on the fly; Flask-Compress suffixes ETags, which breaks
+# conditional requests for responses that carry one (those are pre-compressed instead)
+app.config["COMPRESS_MIMETYPES"] = ["application/json"]
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_LEVEL"] = 6
+app.config["COMPRESS_BR_LEVEL"] = 4
+app.config["COMPRESS_MIN_SIZE"] = 500
+CORS(app)
+Compress(app)
+
 FBI_API_KEY = os.getenv("FBI_API_KEY", "")
 DEFAULT_TIMEOUT = 12
-
-
-def safe_get(url: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> Optional[requests.Response]:
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "50"))
+# Request threads per process (gunicorn.conf.py exports the value it runs with)
+REQUEST_THREADS = int(os.getenv("GUNICORN_THREADS", "16"))
+# Upstream calls each /api/dashboard request fans out
+DASHBOARD_FANOUT = 3
+
+# Shared session so repeated calls to the same upstreams reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "AlertHub/1.0", "Accept-Encoding": "gzip, deflate"})
+_adapter = HTTPAdapter(
+	pool_connections=20,
+	pool_maxsize=HTTP_POOL_MAXSIZE,
+	max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504], allowed_methods=["GET"]),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# Worker pool for fanning out upstream calls from /api/dashboard; sized so that every request
+# thread can fan out at once and tasks never wait in the queue behind each other
+EXECUTOR = ThreadPoolExecutor(max_workers=REQUEST_THREADS * DASHBOARD_FANOUT)
+
+# Upstream request pieces that never vary between calls
+WEATHER_BASE_PARAMS = {
+	"current": ",".join([
+		"temperature_2m",
+		"precipitation",
+		"wind_speed_10m",
+		"relative_humidity_2m",
+		"weather_code",
+	]),
+}
+NWS_HEADERS = {"Accept": "application/geo+json"}
+
+_WEATHER_UNAVAILABLE = orjson.dumps({"current": None, "source": "open-meteo", "note": "unavailable"})
+
+# Upstream results keyed by coordinates snapped to ~0.1 degree (roughly one forecast grid cell)
+WEATHER_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=120)
+ALERTS_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=60)
+_CACHE_LOCK = threading.Lock()
+
+# Last parsed AMBER feed plus the validators needed to revalidate it with a conditional GET
+AMBER_TTL = 60
+_AMBER_LOCK = threading.Lock()
+_AMBER_ETAG: Optional[str] = None
+_AMBER_LASTMOD: Optional[str] = None
+_AMBER_ITEMS: Optional[list[Dict[str, str]]] = None
+_AMBER_TIME = 0.0
+
+
+def safe_get(url: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None, stream: bool = False) -> Optional[requests.Response]:
+	resp = None
 	try:
-		resp = requests.get(url, params=params, headers=headers, timeout=DEFAULT_TIMEOUT)
+		resp = SESSION.get(url, params=params, headers=headers, timeout=DEFAULT_TIMEOUT, stream=stream)
 		resp.raise_for_status()
 		return resp
 	except Exception:
+		# A streamed error body is never read, so release the connection explicitly
+		if resp is not None:
+			resp.close()
 		return None
 
 
-@app.get("/")
-def root() -> Any:
-	return send_from_directory(FRONTEND_DIR, "index.html")
+def raw_json(body: bytes, status: int = 200) -> Response:
+	return app.response_class(body, status=status, mimetype="application/json")
+
+
+def ojson(obj: Any, status: int = 200) -> Response:
+	# orjson encodes straight to bytes, much faster than the stdlib encoder behind jsonify
+	return raw_json(orjson.dumps(obj), status)
+
+
+def precompress(body: bytes) -> Dict[str, bytes]:
+	return {
+		"br": brotli.compress(body, quality=5),
+		"gzip": gzip.compress(body),
+	}
+
+
+def encoded_response(body: bytes, encoded: Dict[str, bytes], etag: str, mimetype: str, cache_control: str) -> Response:
+	# Pick a pre-compressed variant if the client accepts one; each variant has its own ETag
+	encoding = request.accept_encodings.best_match(list(encoded))
+	resp = app.response_class(encoded[encoding] if encoding else body, mimetype=mimetype, headers={"Cache-Control": cache_control, "Vary": "Accept-Encoding"})
+	if encoding:
+		resp.headers["Content-Encoding"] = encoding
+		resp.set_etag(f"{etag}-{encoding}")
+	else:
+		resp.set_etag(etag)
+	return resp.make_conditional(request)
+
+
+# Longest coordinate string accepted; keeps junk input out of the parse_ll cache
+MAX_COORD_LEN = 32
+
+
+def parse_ll(lat: str, lon: str) -> Optional[Tuple[float, float]]:
+	if len(lat) > MAX_COORD_LEN or len(lon) > MAX_COORD_LEN:
+		return None
+	return _parse_ll(lat, lon)
+
+
+@lru_cache(maxsize=2048)
+def _parse_ll(lat: str, lon: str) -> Optional[Tuple[float, float]]:
+	# Repeat clients send identical strings, so parsing and validation are memoised
+	try:
+		lat_f = float(lat)
+		lon_f = float(lon)
+	except ValueError:
+		return None
+	if not (-90.0 <= lat_f <= 90.0 and -180.0 <= lon_f <= 180.0):
+		return None
+	return lat_f, lon_f
+
+
+def grid_key(coords: Tuple[float, float]) -> Tuple[float, float]:
+	return round(coords[0], 1), round(coords[1], 1)
+
+
+def _asset_version(name: str) -> str:
+	with open(os.path.join(FRONTEND_DIR, name), "rb") as fh:
+		return hashlib.blake2b(fh.read()).hexdigest()[:16]
 
 
-@app.get("/styles.css")
-def styles() -> Any:
-	return send_from_directory(FRONTEND_DIR, "styles.css")
+# Content fingerprints for the versioned asset URLs in index.html
+ASSET_VERSIONS = {f"/{name}": _asset_version(name) for name in ("styles.css", "app.js")}
 
 
-@app.get("/app.js")
-def app_js() -> Any:
-	return send_from_directory(FRONTEND_DIR, "app.js")
+def _build_index() -> bytes:
+	with open(os.path.join(FRONTEND_DIR, "index.html"), encoding="utf-8") as fh:
+		html = fh.read()
+	html = re.sub(
+		r'(href|src)="(styles\.css|app\.js)(\?v=[^"]*)?"',
+		lambda m: f'{m.group(1)}="{m.group(2)}?v={ASSET_VERSIONS["/" + m.group(2)]}"',
+		html,
+	)
+	return html.encode("utf-8")
+
+
+INDEX_BODY = _build_index()
+INDEX_ETAG = hashlib.blake2b(INDEX_BODY, digest_size=8).hexdigest()
+INDEX_ENCODED = precompress(INDEX_BODY)
+
+
+@app.after_request
+def cache_assets(resp: Response) -> Response:
+	# Fingerprinted URLs never change content, so browsers may keep them forever
+	version = ASSET_VERSIONS.get(request.path)
+	if version is not None and request.args.get("v") == version and resp.status_code in (200, 304):
+		resp.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+	return resp
+
+
+@app.get("/")
+def root() -> Any:
+	return encoded_response(INDEX_BODY, INDEX_ENCODED, INDEX_ETAG, "text/html", "no-cache")
 
 
 @app.get("/api/health")
 def health() -> Any:
-	return jsonify({"ok": True})
+	return ojson({"ok": True})
 
 
-@app.get("/api/weather")
-def get_weather() -> Any:
-	lat = request.args.get("lat")
-	lon = request.args.get("lon")
-	if not lat or not lon:
-		return jsonify({"error": "lat and lon are required"}), 400
-
-	params = {
-		"latitude": lat,
-		"longitude": lon,
-		"current": ",".join([
-			"temperature_2m",
-			"precipitation",
-			"wind_speed_10m",
-			"relative_humidity_2m",
-			"weather_code",
-		]),
-	}
+def fetch_weather(coords: Tuple[float, float]) -> Tuple[bytes, int]:
+	# Returns the encoded response body; cache hits are served without touching JSON at all
+	key = grid_key(coords)
+	with _CACHE_LOCK:
+		cached = WEATHER_CACHE.get(key)
+	if cached is not None:
+		return cached, 200
+
+	params = {"latitude": coords[0], "longitude": coords[1], **WEATHER_BASE_PARAMS}
 	resp = safe_get("https://api.open-meteo.com/v1/forecast", params=params)
 	if not resp:
-		return jsonify({"current": None, "source": "open-meteo", "note": "unavailable"}), 502
+		return _WEATHER_UNAVAILABLE, 502
 
-	data = resp.json()
-	return jsonify({"current": data.get("current", {}), "source": "open-meteo"})
+	data = orjson.loads(resp.content)
+	body = orjson.dumps({"current": data.get("current", {}), "source": "open-meteo"})
+	with _CACHE_LOCK:
+		WEATHER_CACHE[key] = body
+	return body, 200
 
 
-@app.get("/api/alerts")
-def get_alerts() -> Any:
-	lat = request.args.get("lat")
-	lon = request.args.get("lon")
-	if not lat or not lon:
-		return jsonify({"error": "lat and lon are required"}), 400
+def fetch_alerts(coords: Tuple[float, float]) -> Tuple[Dict[str, Any], int]:
+	key = grid_key(coords)
+	with _CACHE_LOCK:
+		cached = ALERTS_CACHE.get(key)
+	if cached is not None:
+		return cached, 200
 
-	nws = safe_get(f"https://api.weather.gov/alerts/active", params={"point": f"{lat},{lon}"}, headers={"Accept": "application/geo+json"})
+	nws = safe_get(f"https://api.weather.gov/alerts/active", params={"point": f"{coords[0]},{coords[1]}"}, headers=NWS_HEADERS, stream=True)
 	alerts = []
 	if nws:
 		try:
-			features = nws.json().get("features", [])
-			for f in features:
+			# Stream features one at a time instead of materialising the whole GeoJSON document
+			nws.raw.decode_content = True
+			for f in ijson.items(nws.raw, "features.item", use_float=True):
 				props = f.get("properties", {})
 				alerts.append({
 					"id": f.get("id"),
@@ -99,286 +256,433 @@ def get_alerts() -> Any:
 					"instruction": props.get("instruction"),
 				})
 		except Exception:
-			alerts = []
+			return {"alerts": [], "source": "NWS"}, 200
+		finally:
+			nws.close()
 
-	return jsonify({"alerts": alerts, "source": "NWS"})
+		with _CACHE_LOCK:
+			ALERTS_CACHE[key] = {"alerts": alerts, "source": "NWS"}
 
+	return {"alerts": alerts, "source": "NWS"}, 200
 
-@app.get("/api/amber")
-def get_amber() -> Any:
+
+def parse_amber_items(content: bytes) -> list[Dict[str, str]]:
+	# Walk <item> elements with a real XML parser so CDATA and entity refs decode correctly
+	root = etree.fromstring(content, _XML_PARSER)
+	items: list[Dict[str, str]] = []
+	for item in root.iterfind(".//item"):
+		title = item.findtext("title")
+		items.append({
+			"title": title.strip() if title is not None else "AMBER Alert",
+			"link": (item.findtext("link") or "").strip(),
+			"description": (item.findtext("description") or "").strip(),
+		})
+	return items
+
+
+def _tag_text(chunk: str, tag: str) -> Optional[str]:
+	# Single pass per tag: partition on the opening tag, then on the closing tag
+	_, opened, rest = chunk.partition(f"<{tag}>")
+	text, closed, _ = rest.partition(f"</{tag}>")
+	return text.strip() if opened and closed else None
+
+
+def scan_amber_items(text: str) -> list[Dict[str, str]]:
+	# Stdlib-only, naive extraction of items for feeds the XML parser rejects
+	items: list[Dict[str, str]] = []
+	for chunk in text.split("<item>")[1:]:
+		title = _tag_text(chunk, "title")
+		items.append({
+			"title": title if title is not None else "AMBER Alert",
+			"link": _tag_text(chunk, "link") or "",
+			"description": _tag_text(chunk, "description") or "",
+		})
+	return items
+
+
+def fetch_amber() -> Tuple[Dict[str, Any], int]:
+	global _AMBER_ETAG, _AMBER_LASTMOD, _AMBER_ITEMS, _AMBER_TIME
 	# NCMEC AMBER Alert RSS (nationwide)
 	rss_url = "https://www.missingkids.org/feeds/amber.xml"
-	resp = safe_get(rss_url)
+	headers: Dict[str, str] = {}
+	with _AMBER_LOCK:
+		cached_items = _AMBER_ITEMS
+		if cached_items is not None:
+			if time.monotonic() - _AMBER_TIME < AMBER_TTL:
+				return {"items": cached_items, "source": "NCMEC"}, 200
+			# Revalidate instead of refetching; NCMEC answers 304 when the feed is unchanged
+			if _AMBER_ETAG:
+				headers["If-None-Match"] = _AMBER_ETAG
+			if _AMBER_LASTMOD:
+				headers["If-Modified-Since"] = _AMBER_LASTMOD
+
+	resp = safe_get(rss_url, headers=headers or None)
 	if not resp:
-		return jsonify({"items": [], "source": "NCMEC", "note": "unavailable"}), 502
+		if cached_items is None:
+			return {"items": [], "source": "NCMEC", "note": "unavailable"}, 502
+		# Keep serving the last good feed and hold off on retrying for another TTL
+		with _AMBER_LOCK:
+			_AMBER_TIME = time.monotonic()
+		return {"items": cached_items, "source": "NCMEC"}, 200
+
+	if resp.status_code == 304 and cached_items is not None:
+		items = cached_items
+		etag = resp.headers.get("ETag", _AMBER_ETAG)
+		lastmod = resp.headers.get("Last-Modified", _AMBER_LASTMOD)
+	else:
+		try:
+			items = parse_amber_items(resp.content)
+		except Exception:
+			items = scan_amber_items(resp.text)
+		# A fresh body only has the validators it was sent with
+		etag = resp.headers.get("ETag")
+		lastmod = resp.headers.get("Last-Modified")
 
-	text = resp.text
-	# Lightweight, naive extraction of items to avoid adding XML parser dep
-	items: list[Dict[str, str]] = []
-	for chunk in text.split("<item>")[1:]:
-		title_start = chunk.find("<title>")
-		title_end = chunk.find("</title>")
-		link_start = chunk.find("<link>")
-		link_end = chunk.find("</link>")
-		desc_start = chunk.find("<description>")
-		desc_end = chunk.find("</description>")
-		if title_start != -1 and title_end != -1:
-			title = chunk[title_start + 7:title_end].strip()
-		else:
-			title = "AMBER Alert"
-		link = chunk[link_start + 6:link_end].strip() if link_start != -1 and link_end != -1 else ""
-		description = chunk[desc_start + 13:desc_end].strip() if desc_start != -1 and desc_end != -1 else ""
-		items.append({"title": title, "link": link, "description": description})
-
-	return jsonify({"items": items, "source": "NCMEC"})
+	with _AMBER_LOCK:
+		_AMBER_ITEMS = items
+		_AMBER_TIME = time.monotonic()
+		_AMBER_ETAG = etag
+		_AMBER_LASTMOD = lastmod
 
+	return {"items": items, "source": "NCMEC"}, 200
 
-@app.get("/api/protocols")
-def get_protocols() -> Any:
-	# Minimal, general-purpose emergency guidance
-	protocols = [
-		{
-			"type": "tornado",
-			"title": "Tornado Safety",
-			"steps": [
-				"Go to a small, windowless interior room on the lowest level.",
-				"Cover your head and neck; protect from flying debris.",
-				"Avoid windows and large open rooms like gyms.",
-			]
-		},
-		{
-			"type": "earthquake",
-			"title": "Earthquake Safety",
-			"steps": [
-				"Drop, Cover, and Hold On.",
-				"Stay indoors until shaking stops and it is safe to exit.",
-				"If outdoors, move away from buildings, streetlights, and utility wires.",
-			]
-		},
-		{
-			"type": "wildfire",
-			"title": "Wildfire Safety",
-			"steps": [
-				"Prepare to evacuate; keep car fueled and backed in.",
-				"Keep N95 mask for smoke; close windows and doors.",
-				"Follow local evacuation orders immediately.",
-			]
-		},
-		{
-			"type": "flood",
-			"title": "Flood Safety",
-			"steps": [
-				"Turn Around, Don't Drown: avoid driving through floodwaters.",
-				"Move to higher ground; avoid basements and low-lying areas.",
-				"Disconnect electricity if instructed by authorities.",
-			]
-		}
-	]
-	return jsonify({"protocols": protocols})
 
+@app.get("/api/weather")
+def get_weather() -> Any:
+	lat = request.args.get("lat")
+	lon = request.args.get("lon")
+	if not lat or not lon:
+		return ojson({"error": "lat and lon are required"}, 400)
+	coords = parse_ll(lat, lon)
+	if coords is None:
+		return ojson({"error": "lat and lon must be valid coordinates"}, 400)
+
+	body, status = fetch_weather(coords)
+	return raw_json(body, status)
 
-@app.get("/api/crime")
-def get_crime() -> Any:
+
+@app.get("/api/alerts")
+def get_alerts() -> Any:
 	lat = request.args.get("lat")
 	lon = request.args.get("lon")
 	if not lat or not lon:
-		return jsonify({"error": "lat and lon are required"}), 400
-
-	# Simple coordinate-to-state mapping (approximate)
-	lat_f = float(lat)
-	lon_f = float(lon)
-	state_abbr = None
-	
-	# Basic US state boundaries (simplified)
-	if 24.5 <= lat_f <= 31.0 and -87.6 <= lon_f <= -80.0:
-		state_abbr = "FL"
-	elif 30.0 <= lat_f <= 35.0 and -88.0 <= lon_f <= -80.0:
-		state_abbr = "GA"
-	elif 32.0 <= lat_f <= 35.0 and -88.0 <= lon_f <= -80.0:
-		state_abbr = "SC"
-	elif 33.0 <= lat_f <= 36.0 and -84.0 <= lon_f <= -75.0:
-		state_abbr = "NC"
-	elif 36.0 <= lat_f <= 39.0 and -84.0 <= lon_f <= -75.0:
-		state_abbr = "VA"
-	elif 38.0 <= lat_f <= 40.0 and -79.0 <= lon_f <= -75.0:
-		state_abbr = "MD"
-	elif 39.0 <= lat_f <= 42.0 and -80.0 <= lon_f <= -74.0:
-		state_abbr = "PA"
-	elif 40.0 <= lat_f <= 45.0 and -79.0 <= lon_f <= -71.0:
-		state_abbr = "NY"
-	elif 41.0 <= lat_f <= 42.0 and -73.0 <= lon_f <= -71.0:
-		state_abbr = "CT"
-	elif 41.0 <= lat_f <= 43.0 and -72.0 <= lon_f <= -70.0:
-		state_abbr = "MA"
-	elif 43.0 <= lat_f <= 45.0 and -72.0 <= lon_f <= -70.0:
-		state_abbr = "VT"
-	elif 43.0 <= lat_f <= 47.0 and -71.0 <= lon_f <= -66.0:
-		state_abbr = "ME"
-	elif 40.0 <= lat_f <= 42.0 and -75.0 <= lon_f <= -73.0:
-		state_abbr = "NJ"
-	elif 38.0 <= lat_f <= 40.0 and -75.0 <= lon_f <= -73.0:
-		state_abbr = "DE"
-	elif 31.0 <= lat_f <= 37.0 and -114.0 <= lon_f <= -109.0:
-		state_abbr = "AZ"
-	elif 31.0 <= lat_f <= 37.0 and -115.0 <= lon_f <= -108.0:  # Extended range for Arizona
-		state_abbr = "AZ"
-	elif 31.0 <= lat_f <= 37.0 and -109.0 <= lon_f <= -103.0:
-		state_abbr = "NM"
-	elif 25.0 <= lat_f <= 36.0 and -106.0 <= lon_f <= -93.0:
-		state_abbr = "TX"
-	elif 33.0 <= lat_f <= 37.0 and -94.0 <= lon_f <= -89.0:
-		state_abbr = "AR"
-	elif 30.0 <= lat_f <= 35.0 and -94.0 <= lon_f <= -88.0:
-		state_abbr = "LA"
-	elif 30.0 <= lat_f <= 35.0 and -91.0 <= lon_f <= -88.0:
-		state_abbr = "MS"
-	elif 30.0 <= lat_f <= 35.0 and -88.0 <= lon_f <= -84.0:
-		state_abbr = "AL"
-	elif 24.0 <= lat_f <= 31.0 and -87.0 <= lon_f <= -80.0:
-		state_abbr = "FL"
-	elif 40.0 <= lat_f <= 42.0 and -84.0 <= lon_f <= -80.0:
-		state_abbr = "OH"
-	elif 37.0 <= lat_f <= 40.0 and -85.0 <= lon_f <= -81.0:
-		state_abbr = "WV"
-	elif 36.0 <= lat_f <= 39.0 and -85.0 <= lon_f <= -81.0:
-		state_abbr = "KY"
-	elif 35.0 <= lat_f <= 37.0 and -90.0 <= lon_f <= -81.0:
-		state_abbr = "TN"
-	elif 38.0 <= lat_f <= 40.0 and -88.0 <= lon_f <= -84.0:
-		state_abbr = "IN"
-	elif 37.0 <= lat_f <= 42.0 and -91.0 <= lon_f <= -87.0:
-		state_abbr = "IL"
-	elif 40.0 <= lat_f <= 43.0 and -96.0 <= lon_f <= -90.0:
-		state_abbr = "IA"
-	elif 42.0 <= lat_f <= 47.0 and -97.0 <= lon_f <= -89.0:
-		state_abbr = "WI"
-	elif 43.0 <= lat_f <= 49.0 and -97.0 <= lon_f <= -89.0:
-		state_abbr = "MN"
-	elif 40.0 <= lat_f <= 43.0 and -104.0 <= lon_f <= -95.0:
-		state_abbr = "NE"
-	elif 38.0 <= lat_f <= 40.0 and -102.0 <= lon_f <= -94.0:
-		state_abbr = "KS"
-	elif 35.0 <= lat_f <= 37.0 and -103.0 <= lon_f <= -94.0:
-		state_abbr = "OK"
-	elif 36.0 <= lat_f <= 42.0 and -120.0 <= lon_f <= -114.0:
-		state_abbr = "NV"
-	elif 32.0 <= lat_f <= 42.0 and -124.0 <= lon_f <= -114.0:
-		state_abbr = "CA"
-	elif 45.0 <= lat_f <= 49.0 and -125.0 <= lon_f <= -116.0:
-		state_abbr = "WA"
-	elif 42.0 <= lat_f <= 46.0 and -125.0 <= lon_f <= -116.0:
-		state_abbr = "OR"
-	elif 40.0 <= lat_f <= 45.0 and -111.0 <= lon_f <= -104.0:
-		state_abbr = "CO"
-	elif 41.0 <= lat_f <= 45.0 and -112.0 <= lon_f <= -104.0:
-		state_abbr = "UT"
-	elif 42.0 <= lat_f <= 49.0 and -117.0 <= lon_f <= -104.0:
-		state_abbr = "MT"
-	elif 44.0 <= lat_f <= 49.0 and -117.0 <= lon_f <= -104.0:
-		state_abbr = "ND"
-	elif 43.0 <= lat_f <= 46.0 and -104.0 <= lon_f <= -96.0:
-		state_abbr = "SD"
-	elif 40.0 <= lat_f <= 43.0 and -104.0 <= lon_f <= -95.0:
-		state_abbr = "WY"
-	elif 45.0 <= lat_f <= 49.0 and -125.0 <= lon_f <= -66.0:
-		state_abbr = "AK"
-	elif 18.0 <= lat_f <= 22.0 and -162.0 <= lon_f <= -154.0:
-		state_abbr = "HI"
-	
-	# Catch-all for specific coordinates that don't match boundaries
-	if state_abbr is None:
-		if 33.0 <= lat_f <= 34.0 and -112.5 <= lon_f <= -111.0:  # Phoenix area (wider range)
-			state_abbr = "AZ"
-	
-	print(f"DEBUG: Coordinates {lat},{lon} mapped to state: {state_abbr}")
+		return ojson({"error": "lat and lon are required"}, 400)
+	coords = parse_ll(lat, lon)
+	if coords is None:
+		return ojson({"error": "lat and lon must be valid coordinates"}, 400)
+
+	payload, status = fetch_alerts(coords)
+	return ojson(payload, status)
+
+
+@app.get("/api/amber")
+def get_amber() -> Any:
+	payload, status = fetch_amber()
+	return ojson(payload, status)
+
+
+# Minimal, general-purpose emergency guidance
+PROTOCOLS = [
+	{
+		"type": "tornado",
+		"title": "Tornado Safety",
+		"steps": [
+			"Go to a small, windowless interior room on the lowest level.",
+			"Cover your head and neck; protect from flying debris.",
+			"Avoid windows and large open rooms like gyms.",
+		]
+	},
+	{
+		"type": "earthquake",
+		"title": "Earthquake Safety",
+		"steps": [
+			"Drop, Cover, and Hold On.",
+			"Stay indoors until shaking stops and it is safe to exit.",
+			"If outdoors, move away from buildings, streetlights, and utility wires.",
+		]
+	},
+	{
+		"type": "wildfire",
+		"title": "Wildfire Safety",
+		"steps": [
+			"Prepare to evacuate; keep car fueled and backed in.",
+			"Keep N95 mask for smoke; close windows and doors.",
+			"Follow local evacuation orders immediately.",
+		]
+	},
+	{
+		"type": "flood",
+		"title": "Flood Safety",
+		"steps": [
+			"Turn Around, Don't Drown: avoid driving through floodwaters.",
+			"Move to higher ground; avoid basements and low-lying areas.",
+			"Disconnect electricity if instructed by authorities.",
+		]
+	}
+]
+
+# The payload never changes, so it is encoded once and served as-is
+_PROTOCOLS_BODY = orjson.dumps({"protocols": PROTOCOLS})
+_PROTOCOLS_ETAG = hashlib.blake2b(_PROTOCOLS_BODY, digest_size=8).hexdigest()
+_PROTOCOLS_ENCODED = precompress(_PROTOCOLS_BODY)
 
+
+@app.get("/api/protocols")
+def get_protocols() -> Any:
+	return encoded_response(_PROTOCOLS_BODY, _PROTOCOLS_ENCODED, _PROTOCOLS_ETAG, "application/json", "public, max-age=86400")
+
+
+# Basic US state boundaries (simplified): (lat_min, lat_max, lon_min, lon_max, state).
+# Boxes overlap, so order matters and the first match wins.
+STATE_BBOXES: Tuple[Tuple[float, float, float, float, str], ...] = (
+	(24.5, 31.0, -87.6, -80.0, "FL"),
+	(30.0, 35.0, -88.0, -80.0, "GA"),
+	(32.0, 35.0, -88.0, -80.0, "SC"),
+	(33.0, 36.0, -84.0, -75.0, "NC"),
+	(36.0, 39.0, -84.0, -75.0, "VA"),
+	(38.0, 40.0, -79.0, -75.0, "MD"),
+	(39.0, 42.0, -80.0, -74.0, "PA"),
+	(40.0, 45.0, -79.0, -71.0, "NY"),
+	(41.0, 42.0, -73.0, -71.0, "CT"),
+	(41.0, 43.0, -72.0, -70.0, "MA"),
+	(43.0, 45.0, -72.0, -70.0, "VT"),
+	(43.0, 47.0, -71.0, -66.0, "ME"),
+	(40.0, 42.0, -75.0, -73.0, "NJ"),
+	(38.0, 40.0, -75.0, -73.0, "DE"),
+	(31.0, 37.0, -114.0, -109.0, "AZ"),
+	(31.0, 37.0, -115.0, -108.0, "AZ"),  # Extended range for Arizona
+	(31.0, 37.0, -109.0, -103.0, "NM"),
+	(25.0, 36.0, -106.0, -93.0, "TX"),
+	(33.0, 37.0, -94.0, -89.0, "AR"),
+	(30.0, 35.0, -94.0, -88.0, "LA"),
+	(30.0, 35.0, -91.0, -88.0, "MS"),
+	(30.0, 35.0, -88.0, -84.0, "AL"),
+	(24.0, 31.0, -87.0, -80.0, "FL"),
+	(40.0, 42.0, -84.0, -80.0, "OH"),
+	(37.0, 40.0, -85.0, -81.0, "WV"),
+	(36.0, 39.0, -85.0, -81.0, "KY"),
+	(35.0, 37.0, -90.0, -81.0, "TN"),
+	(38.0, 40.0, -88.0, -84.0, "IN"),
+	(37.0, 42.0, -91.0, -87.0, "IL"),
+	(40.0, 43.0, -96.0, -90.0, "IA"),
+	(42.0, 47.0, -97.0, -89.0, "WI"),
+	(43.0, 49.0, -97.0, -89.0, "MN"),
+	(40.0, 43.0, -104.0, -95.0, "NE"),
+	(38.0, 40.0, -102.0, -94.0, "KS"),
+	(35.0, 37.0, -103.0, -94.0, "OK"),
+	(36.0, 42.0, -120.0, -114.0, "NV"),
+	(32.0, 42.0, -124.0, -114.0, "CA"),
+	(45.0, 49.0, -125.0, -116.0, "WA"),
+	(42.0, 46.0, -125.0, -116.0, "OR"),
+	(40.0, 45.0, -111.0, -104.0, "CO"),
+	(41.0, 45.0, -112.0, -104.0, "UT"),
+	(42.0, 49.0, -117.0, -104.0, "MT"),
+	(44.0, 49.0, -117.0, -104.0, "ND"),
+	(43.0, 46.0, -104.0, -96.0, "SD"),
+	(40.0, 43.0, -104.0, -95.0, "WY"),
+	(45.0, 49.0, -125.0, -66.0, "AK"),
+	(18.0, 22.0, -162.0, -154.0, "HI"),
+	# Catch-all for specific coordinates that don't match boundaries
+	(33.0, 34.0, -112.5, -111.0, "AZ"),  # Phoenix area (wider range)
+)
+
+# Outer bounds of every region STATE_BBOXES covers: (lat_min, lat_max, lon_min, lon_max)
+CONUS = (24.0, 49.5, -125.0, -66.0)
+HAWAII = (18.0, 22.0, -162.0, -154.0)
+
+
+def _build_state_grid() -> Dict[Tuple[int, int], Tuple[Tuple[float, float, float, float, str], ...]]:
+	# Index each box under every 1-degree cell it touches, keeping table order within a cell
+	grid: Dict[Tuple[int, int], list] = {}
+	for bbox in STATE_BBOXES:
+		lat_min, lat_max, lon_min, lon_max, _ = bbox
+		for lat_cell in range(math.floor(lat_min), math.floor(lat_max) + 1):
+			for lon_cell in range(math.floor(lon_min), math.floor(lon_max) + 1):
+				grid.setdefault((lat_cell, lon_cell), []).append(bbox)
+	return {cell: tuple(bboxes) for cell, bboxes in grid.items()}
+
+
+STATE_GRID = _build_state_grid()
+
+
+@lru_cache(maxsize=4096)
+def state_for(lat_f: float, lon_f: float) -> Optional[str]:
+	# Simple coordinate-to-state mapping (approximate); only boxes touching the point's cell are checked
+	cell = (math.floor(lat_f), math.floor(lon_f))
+	for lat_min, lat_max, lon_min, lon_max, state_abbr in STATE_GRID.get(cell, ()):
+		if lat_min <= lat_f <= lat_max and lon_min <= lon_f <= lon_max:
+			return state_abbr
+	return None
+
+
+# Column order for the rows in STATE_CRIME_ROWS and DEFAULT_CRIME_ROW
+CRIME_COLS = ("homicide", "robbery", "aggravated_assault", "burglary", "larceny", "motor_vehicle_theft", "violent_crime", "property_crime")
+
+# Realistic mock crime data that varies by state, one row per state in CRIME_COLS order
+STATE_CRIME_ROWS: Mapping[str, Tuple[int, ...]] = MappingProxyType({
+	"NY": (5, 120, 180, 280, 1200, 150, 305, 1630),
+	"CA": (4, 95, 220, 320, 1400, 280, 319, 2000),
+	"TX": (6, 110, 250, 350, 1100, 200, 366, 1650),
+	"FL": (7, 130, 200, 300, 1000, 180, 337, 1480),
+	"AZ": (8, 140, 280, 400, 900, 250, 428, 1550),
+	"IL": (9, 150, 300, 450, 800, 220, 459, 1470),
+	"PA": (5, 100, 180, 250, 700, 150, 285, 1100),
+	"OH": (6, 110, 200, 280, 750, 160, 316, 1190),
+	"GA": (7, 120, 220, 320, 850, 180, 347, 1350),
+	"NC": (6, 105, 190, 270, 720, 140, 301, 1130),
+	"MI": (8, 125, 240, 350, 780, 200, 373, 1330),
+	"NJ": (4, 90, 160, 220, 650, 120, 254, 990),
+	"VA": (5, 95, 170, 240, 680, 130, 270, 1050),
+	"WA": (4, 85, 150, 200, 600, 110, 239, 910),
+	"MA": (3, 80, 140, 180, 550, 100, 223, 830),
+	"TN": (7, 115, 210, 290, 760, 170, 332, 1220),
+	"IN": (6, 100, 180, 260, 700, 150, 286, 1110),
+	"MO": (8, 130, 250, 340, 820, 190, 388, 1350),
+	"MD": (9, 140, 270, 380, 900, 210, 419, 1490),
+	"WI": (5, 90, 160, 220, 620, 120, 255, 960),
+	"CO": (4, 85, 150, 200, 580, 110, 239, 890),
+	"MN": (3, 75, 130, 180, 520, 100, 208, 800),
+	"SC": (8, 125, 230, 320, 800, 180, 363, 1300),
+	"AL": (9, 135, 260, 360, 850, 200, 404, 1420),
+	"LA": (12, 160, 320, 420, 950, 250, 492, 1620),
+	"KY": (6, 105, 190, 270, 720, 150, 301, 1140),
+	"OR": (4, 80, 140, 190, 560, 110, 224, 860),
+	"OK": (7, 115, 220, 300, 750, 170, 342, 1220),
+	"CT": (3, 70, 120, 160, 480, 90, 193, 730),
+	"UT": (2, 60, 100, 140, 400, 80, 162, 620),
+	"IA": (2, 55, 90, 120, 350, 70, 147, 540),
+	"NV": (6, 110, 200, 280, 700, 160, 316, 1140),
+	"AR": (8, 125, 240, 330, 780, 180, 373, 1290),
+	"MS": (10, 145, 280, 380, 900, 220, 435, 1500),
+	"KS": (5, 90, 160, 220, 620, 130, 255, 970),
+	"NM": (8, 130, 250, 340, 800, 190, 388, 1330),
+	"NE": (3, 65, 110, 150, 420, 90, 178, 660),
+	"WV": (6, 100, 180, 250, 680, 140, 286, 1070),
+	"ID": (2, 50, 80, 110, 320, 60, 132, 490),
+	"HI": (2, 45, 70, 100, 280, 50, 117, 430),
+	"NH": (1, 40, 60, 80, 240, 40, 101, 360),
+	"ME": (1, 35, 50, 70, 200, 35, 86, 305),
+	"MT": (2, 45, 70, 90, 260, 50, 117, 400),
+	"RI": (2, 50, 80, 100, 300, 60, 132, 460),
+	"DE": (4, 70, 120, 160, 480, 100, 194, 740),
+	"SD": (2, 40, 60, 80, 220, 40, 102, 340),
+	"ND": (1, 30, 40, 60, 160, 30, 71, 250),
+	"AK": (4, 60, 100, 120, 360, 80, 164, 560),
+	"VT": (1, 25, 35, 50, 140, 25, 61, 215),
+	"WY": (1, 20, 30, 40, 120, 20, 51, 180),
+})
+
+DEFAULT_CRIME_ROW = (5, 100, 180, 250, 700, 150, 285, 1100)
+
+DEMO_CRIME_STATS: Dict[str, int] = {
+	"homicide": 3,
+	"robbery": 55,
+	"aggravated_assault": 210,
+	"burglary": 230,
+	"larceny": 900,
+	"motor_vehicle_theft": 220,
+	"violent_crime": 420,
+	"property_crime": 1350,
+	"year": 2023
+}
+
+
+def locate_state(coords: Tuple[float, float]) -> Optional[str]:
+	lat_f, lon_f = coords
+	# Reject points outside the covered regions before they reach (and churn) the state_for cache
+	in_us = (CONUS[0] <= lat_f <= CONUS[1]) & (CONUS[2] <= lon_f <= CONUS[3]) | (HAWAII[0] <= lat_f <= HAWAII[1]) & (HAWAII[2] <= lon_f <= HAWAII[3])
+	return state_for(lat_f, lon_f) if in_us else None
+
+
+def crime_payload(state_abbr: Optional[str]) -> Dict[str, Any]:
 	# Generate location-based mock crime data
 	if state_abbr and len(state_abbr) == 2:
-		# Create realistic crime data that varies by state
-		state_crime_rates = {
-			"NY": {"homicide": 5, "robbery": 120, "aggravated_assault": 180, "burglary": 280, "larceny": 1200, "motor_vehicle_theft": 150, "violent_crime": 305, "property_crime": 1630},
-			"CA": {"homicide": 4, "robbery": 95, "aggravated_assault": 220, "burglary": 320, "larceny": 1400, "motor_vehicle_theft": 280, "violent_crime": 319, "property_crime": 2000},
-			"TX": {"homicide": 6, "robbery": 110, "aggravated_assault": 250, "burglary": 350, "larceny": 1100, "motor_vehicle_theft": 200, "violent_crime": 366, "property_crime": 1650},
-			"FL": {"homicide": 7, "robbery": 130, "aggravated_assault": 200, "burglary": 300, "larceny": 1000, "motor_vehicle_theft": 180, "violent_crime": 337, "property_crime": 1480},
-			"AZ": {"homicide": 8, "robbery": 140, "aggravated_assault": 280, "burglary": 400, "larceny": 900, "motor_vehicle_theft": 250, "violent_crime": 428, "property_crime": 1550},
-			"IL": {"homicide": 9, "robbery": 150, "aggravated_assault": 300, "burglary": 450, "larceny": 800, "motor_vehicle_theft": 220, "violent_crime": 459, "property_crime": 1470},
-			"PA": {"homicide": 5, "robbery": 100, "aggravated_assault": 180, "burglary": 250, "larceny": 700, "motor_vehicle_theft": 150, "violent_crime": 285, "property_crime": 1100},
-			"OH": {"homicide": 6, "robbery": 110, "aggravated_assault": 200, "burglary": 280, "larceny": 750, "motor_vehicle_theft": 160, "violent_crime": 316, "property_crime": 1190},
-			"GA": {"homicide": 7, "robbery": 120, "aggravated_assault": 220, "burglary": 320, "larceny": 850, "motor_vehicle_theft": 180, "violent_crime": 347, "property_crime": 1350},
-			"NC": {"homicide": 6, "robbery": 105, "aggravated_assault": 190, "burglary": 270, "larceny": 720, "motor_vehicle_theft": 140, "violent_crime": 301, "property_crime": 1130},
-			"MI": {"homicide": 8, "robbery": 125, "aggravated_assault": 240, "burglary": 350, "larceny": 780, "motor_vehicle_theft": 200, "violent_crime": 373, "property_crime": 1330},
-			"NJ": {"homicide": 4, "robbery": 90, "aggravated_assault": 160, "burglary": 220, "larceny": 650, "motor_vehicle_theft": 120, "violent_crime": 254, "property_crime": 990},
-			"VA": {"homicide": 5, "robbery": 95, "aggravated_assault": 170, "burglary": 240, "larceny": 680, "motor_vehicle_theft": 130, "violent_crime": 270, "property_crime": 1050},
-			"WA": {"homicide": 4, "robbery": 85, "aggravated_assault": 150, "burglary": 200, "larceny": 600, "motor_vehicle_theft": 110, "violent_crime": 239, "property_crime": 910},
-			"MA": {"homicide": 3, "robbery": 80, "aggravated_assault": 140, "burglary": 180, "larceny": 550, "motor_vehicle_theft": 100, "violent_crime": 223, "property_crime": 830},
-			"TN": {"homicide": 7, "robbery": 115, "aggravated_assault": 210, "burglary": 290, "larceny": 760, "motor_vehicle_theft": 170, "violent_crime": 332, "property_crime": 1220},
-			"IN": {"homicide": 6, "robbery": 100, "aggravated_assault": 180, "burglary": 260, "larceny": 700, "motor_vehicle_theft": 150, "violent_crime": 286, "property_crime": 1110},
-			"MO": {"homicide": 8, "robbery": 130, "aggravated_assault": 250, "burglary": 340, "larceny": 820, "motor_vehicle_theft": 190, "violent_crime": 388, "property_crime": 1350},
-			"MD": {"homicide": 9, "robbery": 140, "aggravated_assault": 270, "burglary": 380, "larceny": 900, "motor_vehicle_theft": 210, "violent_crime": 419, "property_crime": 1490},
-			"WI": {"homicide": 5, "robbery": 90, "aggravated_assault": 160, "burglary": 220, "larceny": 620, "motor_vehicle_theft": 120, "violent_crime": 255, "property_crime": 960},
-			"CO": {"homicide": 4, "robbery": 85, "aggravated_assault": 150, "burglary": 200, "larceny": 580, "motor_vehicle_theft": 110, "violent_crime": 239, "property_crime": 890},
-			"MN": {"homicide": 3, "robbery": 75, "aggravated_assault": 130, "burglary": 180, "larceny": 520, "motor_vehicle_theft": 100, "violent_crime": 208, "property_crime": 800},
-			"SC": {"homicide": 8, "robbery": 125, "aggravated_assault": 230, "burglary": 320, "larceny": 800, "motor_vehicle_theft": 180, "violent_crime": 363, "property_crime": 1300},
-			"AL": {"homicide": 9, "robbery": 135, "aggravated_assault": 260, "burglary": 360, "larceny": 850, "motor_vehicle_theft": 200, "violent_crime": 404, "property_crime": 1420},
-			"LA": {"homicide": 12, "robbery": 160, "aggravated_assault": 320, "burglary": 420, "larceny": 950, "motor_vehicle_theft": 250, "violent_crime": 492, "property_crime": 1620},
-			"KY": {"homicide": 6, "robbery": 105, "aggravated_assault": 190, "burglary": 270, "larceny": 720, "motor_vehicle_theft": 150, "violent_crime": 301, "property_crime": 1140},
-			"OR": {"homicide": 4, "robbery": 80, "aggravated_assault": 140, "burglary": 190, "larceny": 560, "motor_vehicle_theft": 110, "violent_crime": 224, "property_crime": 860},
-			"OK": {"homicide": 7, "robbery": 115, "aggravated_assault": 220, "burglary": 300, "larceny": 750, "motor_vehicle_theft": 170, "violent_crime": 342, "property_crime": 1220},
-			"CT": {"homicide": 3, "robbery": 70, "aggravated_assault": 120, "burglary": 160, "larceny": 480, "motor_vehicle_theft": 90, "violent_crime": 193, "property_crime": 730},
-			"UT": {"homicide": 2, "robbery": 60, "aggravated_assault": 100, "burglary": 140, "larceny": 400, "motor_vehicle_theft": 80, "violent_crime": 162, "property_crime": 620},
-			"IA": {"homicide": 2, "robbery": 55, "aggravated_assault": 90, "burglary": 120, "larceny": 350, "motor_vehicle_theft": 70, "violent_crime": 147, "property_crime": 540},
-			"NV": {"homicide": 6, "robbery": 110, "aggravated_assault": 200, "burglary": 280, "larceny": 700, "motor_vehicle_theft": 160, "violent_crime": 316, "property_crime": 1140},
-			"AR": {"homicide": 8, "robbery": 125, "aggravated_assault": 240, "burglary": 330, "larceny": 780, "motor_vehicle_theft": 180, "violent_crime": 373, "property_crime": 1290},
-			"MS": {"homicide": 10, "robbery": 145, "aggravated_assault": 280, "burglary": 380, "larceny": 900, "motor_vehicle_theft": 220, "violent_crime": 435, "property_crime": 1500},
-			"KS": {"homicide": 5, "robbery": 90, "aggravated_assault": 160, "burglary": 220, "larceny": 620, "motor_vehicle_theft": 130, "violent_crime": 255, "property_crime": 970},
-			"NM": {"homicide": 8, "robbery": 130, "aggravated_assault": 250, "burglary": 340, "larceny": 800, "motor_vehicle_theft": 190, "violent_crime": 388, "property_crime": 1330},
-			"NE": {"homicide": 3, "robbery": 65, "aggravated_assault": 110, "burglary": 150, "larceny": 420, "motor_vehicle_theft": 90, "violent_crime": 178, "property_crime": 660},
-			"WV": {"homicide": 6, "robbery": 100, "aggravated_assault": 180, "burglary": 250, "larceny": 680, "motor_vehicle_theft": 140, "violent_crime": 286, "property_crime": 1070},
-			"ID": {"homicide": 2, "robbery": 50, "aggravated_assault": 80, "burglary": 110, "larceny": 320, "motor_vehicle_theft": 60, "violent_crime": 132, "property_crime": 490},
-			"HI": {"homicide": 2, "robbery": 45, "aggravated_assault": 70, "burglary": 100, "larceny": 280, "motor_vehicle_theft": 50, "violent_crime": 117, "property_crime": 430},
-			"NH": {"homicide": 1, "robbery": 40, "aggravated_assault": 60, "burglary": 80, "larceny": 240, "motor_vehicle_theft": 40, "violent_crime": 101, "property_crime": 360},
-			"ME": {"homicide": 1, "robbery": 35, "aggravated_assault": 50, "burglary": 70, "larceny": 200, "motor_vehicle_theft": 35, "violent_crime": 86, "property_crime": 305},
-			"MT": {"homicide": 2, "robbery": 45, "aggravated_assault": 70, "burglary": 90, "larceny": 260, "motor_vehicle_theft": 50, "violent_crime": 117, "property_crime": 400},
-			"RI": {"homicide": 2, "robbery": 50, "aggravated_assault": 80, "burglary": 100, "larceny": 300, "motor_vehicle_theft": 60, "violent_crime": 132, "property_crime": 460},
-			"DE": {"homicide": 4, "robbery": 70, "aggravated_assault": 120, "burglary": 160, "larceny": 480, "motor_vehicle_theft": 100, "violent_crime": 194, "property_crime": 740},
-			"SD": {"homicide": 2, "robbery": 40, "aggravated_assault": 60, "burglary": 80, "larceny": 220, "motor_vehicle_theft": 40, "violent_crime": 102, "property_crime": 340},
-			"ND": {"homicide": 1, "robbery": 30, "aggravated_assault": 40, "burglary": 60, "larceny": 160, "motor_vehicle_theft": 30, "violent_crime": 71, "property_crime": 250},
-			"AK": {"homicide": 4, "robbery": 60, "aggravated_assault": 100, "burglary": 120, "larceny": 360, "motor_vehicle_theft": 80, "violent_crime": 164, "property_crime": 560},
-			"VT": {"homicide": 1, "robbery": 25, "aggravated_assault": 35, "burglary": 50, "larceny": 140, "motor_vehicle_theft": 25, "violent_crime": 61, "property_crime": 215},
-			"WY": {"homicide": 1, "robbery": 20, "aggravated_assault": 30, "burglary": 40, "larceny": 120, "motor_vehicle_theft": 20, "violent_crime": 51, "property_crime": 180}
-		}
-		
-		crime_data = state_crime_rates.get(state_abbr, {
-			"homicide": 5, "robbery": 100, "aggravated_assault": 180, "burglary": 250, 
-			"larceny": 700, "motor_vehicle_theft": 150, "violent_crime": 285, "property_crime": 1100
-		})
+		crime_data = dict(zip(CRIME_COLS, STATE_CRIME_ROWS.get(state_abbr, DEFAULT_CRIME_ROW)))
 		
-		return jsonify({
+		return {
 			"scope": "state",
 			"source": "mock",
 			"state": state_abbr,
 			"stats": crime_data
-		})
+		}
 
 	# Fallback to demo data
-	return jsonify({
+	return {
 		"scope": "demo",
 		"source": "demo",
 		"state": state_abbr,
-		"stats": {
-			"homicide": 3,
-			"robbery": 55,
-			"aggravated_assault": 210,
-			"burglary": 230,
-			"larceny": 900,
-			"motor_vehicle_theft": 220,
-			"violent_crime": 420,
-			"property_crime": 1350,
-			"year": 2023
-		}
-	})
+		"stats": DEMO_CRIME_STATS
+	}
+
+
+# Every response /api/crime can give for a known state (plus the demo fallback), encoded once
+_CRIME_BODIES: Dict[Optional[str], bytes] = {st: orjson.dumps(crime_payload(st)) for st in STATE_CRIME_ROWS}
+_CRIME_BODIES[None] = orjson.dumps(crime_payload(None))
+
+
+def crime_body(state_abbr: Optional[str]) -> bytes:
+	body = _CRIME_BODIES.get(state_abbr)
+	if body is None:
+		body = orjson.dumps(crime_payload(state_abbr))
+	return body
+
+
+@app.get("/api/crime")
+def get_crime() -> Any:
+	lat = request.args.get("lat")
+	lon = request.args.get("lon")
+	if not lat or not lon:
+		return ojson({"error": "lat and lon are required"}, 400)
+	coords = parse_ll(lat, lon)
+	if coords is None:
+		return ojson({"error": "lat and lon must be valid coordinates"}, 400)
+
+	return raw_json(crime_body(locate_state(coords)))
+
+
+@app.get("/api/dashboard")
+def get_dashboard() -> Any:
+	lat = request.args.get("lat")
+	lon = request.args.get("lon")
+	if not lat or not lon:
+		return ojson({"error": "lat and lon are required"}, 400)
+	coords = parse_ll(lat, lon)
+	if coords is None:
+		return ojson({"error": "lat and lon must be valid coordinates"}, 400)
+
+	# Overlap the upstream calls; total latency is the slowest one rather than the sum
+	futures = {
+		EXECUTOR.submit(fetch_weather, coords): "weather",
+		EXECUTOR.submit(fetch_alerts, coords): "alerts",
+		EXECUTOR.submit(fetch_amber): "amber",
+	}
+	weather_body = b"null"
+	crime = crime_body(locate_state(coords))
+	result: Dict[str, Any] = {"alerts": None, "amber": None}
+	try:
+		for future in as_completed(futures, timeout=DEFAULT_TIMEOUT):
+			section = futures[future]
+			try:
+				value, status = future.result()
+			except Exception:
+				continue
+			# Failed upstreams stay null so the frontend can say the section is unavailable
+			if status != 200:
+				continue
+			if section == "weather":
+				weather_body = value
+			else:
+				result[section] = value
+	except FuturesTimeout:
+		# Drop anything that has not started yet instead of leaving it to occupy the pool
+		for future in futures:
+			future.cancel()
+
+	# Weather and crime arrive already encoded; splice them in rather than decoding them again
+	return raw_json(b'{"weather":' + weather_body + b',"crime":' + crime + b"," + orjson.dumps(result)[1:])
 
 
 if __name__ == "__main__":
+	# Local development only; production runs under gunicorn (see gunicorn.conf.py)
 	port = int(os.getenv("PORT", "5002"))
 	app.run(host="0.0.0.0", port=port)
@@ -20,43 +20,88 @@ Humidity: ${w.relative_humidity_2m}%
 Weather Code: ${w.weather_code}`;
 }
 
-async function loadAll(lat, lon) {
-    setCoords(lat, lon);
-    try {
-        const weather = await fetchJSON(`/api/weather?lat=${lat}&lon=${lon}`);
-        $("#weatherData").textContent = formatWeather(weather);
-    } catch (e) {
+function renderWeather(weather) {
+    if (!weather) {
         $("#weatherData").textContent = "Weather unavailable.";
+        return;
     }
+    $("#weatherData").textContent = formatWeather(weather);
+}
 
-    try {
-        const alerts = await fetchJSON(`/api/alerts?lat=${lat}&lon=${lon}`);
-        const list = $("#alertsList");
-        list.innerHTML = "";
-        (alerts.alerts || []).slice(0, 10).forEach((a) => {
-            const li = document.createElement("li");
-            li.textContent = `${a.event || "Alert"}: ${a.headline || a.areaDesc || ""}`;
-            list.appendChild(li);
-        });
-    } catch (e) {
+function renderAlerts(alerts) {
+    if (!alerts) {
         $("#alertsList").innerHTML = "<li>Alerts unavailable.</li>";
+        return;
+    }
+    const list = $("#alertsList");
+    list.innerHTML = "";
+    (alerts.alerts || []).slice(0, 10).forEach((a) => {
+        const li = document.createElement("li");
+        li.textContent = `${a.event || "Alert"}: ${a.headline || a.areaDesc || ""}`;
+        list.appendChild(li);
+    });
+}
+
+function renderAmber(amber) {
+    if (!amber) {
+        $("#amberList").innerHTML = "<li>AMBER feed unavailable.</li>";
+        return;
+    }
+    const list = $("#amberList");
+    list.innerHTML = "";
+    (amber.items || []).slice(0, 10).forEach((i) => {
+        const li = document.createElement("li");
+        const a = document.createElement("a");
+        a.href = i.link || "#";
+        a.target = "_blank";
+        a.textContent = i.title || "AMBER Alert";
+        li.appendChild(a);
+        list.appendChild(li);
+    });
+}
+
+function formatCrime(crime) {
+    if (!crime || !crime.stats) return "No crime data available";
+    const s = crime.stats;
+    const year = s.year || "N/A";
+    return `Crime Statistics (${year})
+State: ${crime.state || "Unknown"}
+
+Violent Crime: ${s.violent_crime || "N/A"}
+• Homicide: ${s.homicide || "N/A"}
+• Robbery: ${s.robbery || "N/A"}
+• Aggravated Assault: ${s.aggravated_assault || "N/A"}
+
+Property Crime: ${s.property_crime || "N/A"}
+• Burglary: ${s.burglary || "N/A"}
+• Larceny: ${s.larceny || "N/A"}
+• Motor Vehicle Theft: ${s.motor_vehicle_theft || "N/A"}
+
+Source: ${crime.source || "Unknown"}`;
+}
+
+function renderCrime(crime) {
+    if (!crime) {
+        $("#crimeData").textContent = "Crime data unavailable.";
+        return;
     }
+    $("#crimeData").textContent = formatCrime(crime);
+}
 
+async function loadAll(lat, lon) {
+    setCoords(lat, lon);
+    // Weather, alerts, AMBER and crime are fetched server-side in parallel
     try {
-        const amber = await fetchJSON(`/api/amber`);
-        const list = $("#amberList");
-        list.innerHTML = "";
-        (amber.items || []).slice(0, 10).forEach((i) => {
-            const li = document.createElement("li");
-            const a = document.createElement("a");
-            a.href = i.link || "#";
-            a.target = "_blank";
-            a.textContent = i.title || "AMBER Alert";
-            li.appendChild(a);
-            list.appendChild(li);
-        });
+        const dashboard = await fetchJSON(`/api/dashboard?lat=${lat}&lon=${lon}`);
+        renderWeather(dashboard.weather);
+        renderAlerts(dashboard.alerts);
+        renderAmber(dashboard.amber);
+        renderCrime(dashboard.crime);
     } catch (e) {
-        $("#amberList").innerHTML = "<li>AMBER feed unavailable.</li>";
+        renderWeather(null);
+        renderAlerts(null);
+        renderAmber(null);
+        renderCrime(null);
     }
 
     try {
@@ -81,33 +126,6 @@ async function loadAll(lat, lon) {
     } catch (e) {
         $("#protocolsList").textContent = "Protocols unavailable.";
     }
-
-    function formatCrime(crime) {
-        if (!crime || !crime.stats) return "No crime data available";
-        const s = crime.stats;
-        const year = s.year || "N/A";
-        return `Crime Statistics (${year})
-State: ${crime.state || "Unknown"}
-
-Violent Crime: ${s.violent_crime || "N/A"}
-• Homicide: ${s.homicide || "N/A"}
-• Robbery: ${s.robbery || "N/A"}
-• Aggravated Assault: ${s.aggravated_assault || "N/A"}
-
-Property Crime: ${s.property_crime || "N/A"}
-• Burglary: ${s.burglary || "N/A"}
-• Larceny: ${s.larceny || "N/A"}
-• Motor Vehicle Theft: ${s.motor_vehicle_theft || "N/A"}
-
-Source: ${crime.source || "Unknown"}`;
-    }
-
-    try {
-        const crime = await fetchJSON(`/api/crime?lat=${lat}&lon=${lon}`);
-        $("#crimeData").textContent = formatCrime(crime);
-    } catch (e) {
-        $("#crimeData").textContent = "Crime data unavailable.";
-    }
 }
 
 async function geocodeZipcode(zipcode) {
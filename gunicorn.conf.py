@@ -0,0 +1,16 @@
+import multiprocessing
+import os
+
+# Production entry point: `gunicorn` from the repo root picks this file up automatically.
+# gthread workers let the blocking upstream calls of concurrent requests overlap.
+wsgi_app = "backend.app:app"
+bind = f"0.0.0.0:{os.getenv('PORT', '5002')}"
+worker_class = "gthread"
+workers = int(os.getenv("WEB_CONCURRENCY", str(2 * multiprocessing.cpu_count())))
+threads = int(os.getenv("GUNICORN_THREADS", "16"))
+timeout = 30
+
+# The app sizes its dashboard fan-out pool from the thread count
+os.environ["GUNICORN_THREADS"] = str(threads)
+# Each worker has its own requests pool; size it for every request thread plus the fan-out pool (3 per thread)
+os.environ.setdefault("HTTP_POOL_MAXSIZE", str(max(50, threads * 4)))